@@ -1,8 +1,12 @@
 from .base_crawler import BaseCrawler
 from .base_pipeline import BasePipeline
+from .dupefilters import BaseDupeFilter, BloomDupeFilter, SetDupeFilter
+from .frontiers import BaseFrontier, DiskFrontier, MemoryFrontier
 from .models import (
     CrawlerSettings,
     CrawlerStats,
+    DupeFilterSettings,
+    FrontierSettings,
     HttpClientSettings,
     LogSettings,
     Request,
@@ -5,8 +5,11 @@ from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
 from httpx import AsyncClient, Limits
 
+from fastcrawl.dupefilters import BaseDupeFilter
 from fastcrawl.models import CrawlerSettings, CrawlerStats, Request, Response
+from fastcrawl.scheduler import Scheduler
 from fastcrawl.utils.log import get_logger, setup_logging
+from fastcrawl.utils.serialization import RequestSerializer
 
 if TYPE_CHECKING:
     from fastcrawl.base_pipeline import BasePipeline  # pragma: no cover
@@ -31,7 +34,8 @@ class BaseCrawler(ABC):
     stats: CrawlerStats
 
     _pipelines: list["BasePipeline"]
-    _queue: asyncio.Queue
+    _scheduler: Scheduler
+    _dupefilter: Optional[BaseDupeFilter]
     _http_client: AsyncClient
 
     def __init__(self, settings: Optional[CrawlerSettings] = None) -> None:
@@ -43,7 +47,14 @@ class BaseCrawler(ABC):
         self.stats = CrawlerStats()
 
         self._pipelines = [pipeline(self.settings.log) for pipeline in self.settings.pipelines]
-        self._queue = asyncio.Queue()
+        self._scheduler = Scheduler(
+            self.settings.frontier.frontier_class(self.settings.frontier, RequestSerializer(self))
+        )
+        self._dupefilter = (
+            self.settings.dupefilter.dupefilter_class(self.settings.dupefilter)
+            if self.settings.dupefilter.dupefilter_class
+            else None
+        )
         self._http_client = AsyncClient(**self._get_http_client_kwargs())
 
     def _get_http_client_kwargs(self) -> dict[str, Any]:
@@ -77,15 +88,18 @@ class BaseCrawler(ABC):
         for pipeline in self._pipelines:
             await pipeline.on_start()
 
-        async for request in self.generate_requests():
-            await self._queue.put(request)
-
         workers = [asyncio.create_task(self._worker()) for _ in range(self.settings.workers)]
-        await self._queue.join()
-        for worker in workers:
-            worker.cancel()
+        try:
+            await self._put_seed_requests()
+            await self._scheduler.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
 
         await self._http_client.aclose()
+        self._scheduler.close()
+        if self._dupefilter:
+            self._dupefilter.close()
 
         await self.on_finish()
         for pipeline in self._pipelines:
@@ -93,15 +107,20 @@ class BaseCrawler(ABC):
         self.stats.finish_crawling()
         self.logger.info("Crawling finished with stats: %s", self.stats.model_dump_json(indent=2))
 
+    async def _put_seed_requests(self) -> None:
+        async for request in self.generate_requests():
+            await self._scheduler.wait_for_space(self.settings.seed_queue_size)
+            await self._schedule_request(request)
+
     async def _worker(self) -> None:
         while True:
-            request = await self._queue.get()
+            request = await self._scheduler.get()
             try:
                 await self._process_request(request)
             except Exception as exc:  # pylint: disable=W0718
                 self.logger.error("Error processing request %s: %s", request, exc)
             finally:
-                self._queue.task_done()
+                self._scheduler.task_done()
 
     async def _process_request(self, request: Request) -> None:
         self.logger.debug("Processing request: %s", request)
@@ -124,7 +143,7 @@ class BaseCrawler(ABC):
         if hasattr(result, "__aiter__"):
             async for item in result:
                 if isinstance(item, Request):
-                    await self._queue.put(item)
+                    await self._schedule_request(item)
                 elif item is not None:
                     for pipeline in self._pipelines:
                         item = await pipeline.process_allowed_item(item)
@@ -135,8 +154,15 @@ class BaseCrawler(ABC):
         else:
             await result
 
+    async def _schedule_request(self, request: Request) -> None:
+        if self._dupefilter and not request.dont_filter and self._dupefilter.request_seen(request):
+            self.logger.debug("Filtered duplicate request: %s", request)
+            self.stats.add_filtered_request()
+            return
+        await self._scheduler.put(request)
+
     def _get_request_kwargs(self, request: Request) -> dict[str, Any]:
-        kwargs = request.model_dump(exclude_none=True, exclude={"callback", "callback_data", "errback"})
+        kwargs = request.model_dump(exclude_none=True, exclude={"callback", "callback_data", "errback", "dont_filter"})
         if "query_params" in kwargs:
             kwargs["params"] = kwargs.pop("query_params")
         if "form_data" in kwargs:
@@ -0,0 +1,3 @@
+from .base_dupefilter import BaseDupeFilter
+from .bloom_dupefilter import BloomDupeFilter
+from .set_dupefilter import SetDupeFilter
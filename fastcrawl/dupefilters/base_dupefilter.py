@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from fastcrawl.utils.fingerprint import get_request_fingerprint
+
+if TYPE_CHECKING:
+    from fastcrawl.models.request import Request  # pragma: no cover
+    from fastcrawl.models.dupefilter_settings import DupeFilterSettings  # pragma: no cover
+
+
+class BaseDupeFilter(ABC):
+    """Base for all duplicate request filters.
+
+    Args:
+        settings (DupeFilterSettings): Settings for the filter.
+
+    Attributes:
+        settings (DupeFilterSettings): Settings for the filter.
+
+    """
+
+    settings: "DupeFilterSettings"
+
+    def __init__(self, settings: "DupeFilterSettings") -> None:
+        self.settings = settings
+
+    @abstractmethod
+    def fingerprint_seen(self, fingerprint: bytes) -> bool:
+        """Returns whether the fingerprint was seen before and marks it as seen.
+
+        Args:
+            fingerprint (bytes): Request fingerprint.
+
+        """
+
+    def request_seen(self, request: "Request") -> bool:
+        """Returns whether the same request was seen before and marks it as seen.
+
+        Args:
+            request (Request): Request to check.
+
+        """
+        return self.fingerprint_seen(get_request_fingerprint(request))
+
+    def close(self) -> None:
+        """Releases resources used by the filter."""
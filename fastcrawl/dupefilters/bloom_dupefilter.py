@@ -0,0 +1,42 @@
+import math
+from typing import TYPE_CHECKING
+
+from fastcrawl.dupefilters.base_dupefilter import BaseDupeFilter
+
+if TYPE_CHECKING:
+    from fastcrawl.models.dupefilter_settings import DupeFilterSettings  # pragma: no cover
+
+
+class BloomDupeFilter(BaseDupeFilter):
+    """Filter which stores request fingerprints in a Bloom filter.
+
+    Note:
+        Memory usage is fixed and depends only on `capacity` and `error_rate` settings
+        (about 1.8 MB per million fingerprints with 0.1% error rate). With probability of about `error_rate`
+        a new request is considered as seen and filtered, but seen requests are never passed twice.
+
+    """
+
+    bits_count: int
+    hashes_count: int
+    _bits: bytearray
+
+    def __init__(self, settings: "DupeFilterSettings") -> None:
+        super().__init__(settings)
+        self.bits_count = max(8, math.ceil(-settings.capacity * math.log(settings.error_rate) / math.log(2) ** 2))
+        self.hashes_count = max(1, round(self.bits_count / settings.capacity * math.log(2)))
+        self._bits = bytearray((self.bits_count + 7) // 8)
+
+    def fingerprint_seen(self, fingerprint: bytes) -> bool:
+        """See `BaseDupeFilter` class."""
+        first_hash = int.from_bytes(fingerprint[:8], "little")
+        second_hash = int.from_bytes(fingerprint[8:16], "little") | 1
+
+        seen = True
+        for index in range(self.hashes_count):
+            position = (first_hash + index * second_hash) % self.bits_count
+            mask = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                seen = False
+        return seen
@@ -0,0 +1,26 @@
+from typing import TYPE_CHECKING
+
+from fastcrawl.dupefilters.base_dupefilter import BaseDupeFilter
+
+if TYPE_CHECKING:
+    from fastcrawl.models.dupefilter_settings import DupeFilterSettings  # pragma: no cover
+
+
+class SetDupeFilter(BaseDupeFilter):
+    """Filter which stores exact request fingerprints in memory."""
+
+    _fingerprints: set[bytes]
+
+    def __init__(self, settings: "DupeFilterSettings") -> None:
+        super().__init__(settings)
+        self._fingerprints = set()
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def fingerprint_seen(self, fingerprint: bytes) -> bool:
+        """See `BaseDupeFilter` class."""
+        if fingerprint in self._fingerprints:
+            return True
+        self._fingerprints.add(fingerprint)
+        return False
@@ -0,0 +1,3 @@
+from .base_frontier import BaseFrontier
+from .disk_frontier import DiskFrontier
+from .memory_frontier import MemoryFrontier
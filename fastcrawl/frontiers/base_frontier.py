@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from fastcrawl.models.request import Request
+from fastcrawl.utils.serialization import RequestSerializer
+
+if TYPE_CHECKING:
+    from fastcrawl.models.frontier_settings import FrontierSettings  # pragma: no cover
+
+
+class BaseFrontier(ABC):
+    """Base for all frontiers. Frontier stores requests waiting to be processed by the crawler.
+
+    Args:
+        settings (FrontierSettings): Settings for the frontier.
+        serializer (RequestSerializer): Serializer for frontiers which store requests outside of memory.
+
+    Attributes:
+        settings (FrontierSettings): Settings for the frontier.
+        serializer (RequestSerializer): Serializer for frontiers which store requests outside of memory.
+
+    """
+
+    settings: "FrontierSettings"
+    serializer: RequestSerializer
+
+    def __init__(self, settings: "FrontierSettings", serializer: RequestSerializer) -> None:
+        self.settings = settings
+        self.serializer = serializer
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of stored requests."""
+
+    @abstractmethod
+    def push(self, request: Request) -> None:
+        """Stores a request.
+
+        Args:
+            request (Request): Request to store.
+
+        """
+
+    @abstractmethod
+    def pop(self) -> Request:
+        """Removes and returns the next request.
+
+        Raises:
+            IndexError: If the frontier is empty.
+
+        """
+
+    def close(self) -> None:
+        """Releases resources used by the frontier."""
@@ -0,0 +1,93 @@
+import pickle
+import sqlite3
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastcrawl.frontiers.base_frontier import BaseFrontier
+from fastcrawl.models.request import Request
+from fastcrawl.utils.serialization import RequestSerializer
+
+if TYPE_CHECKING:
+    from fastcrawl.models.frontier_settings import FrontierSettings  # pragma: no cover
+
+
+class DiskFrontier(BaseFrontier):
+    """Frontier which keeps up to `memory_limit` requests in memory and spills the rest to SQLite on disk.
+
+    Note:
+        Requests are returned in FIFO order. Spilled requests are written and read back in batches of
+        `batch_size`, so requests never touch the disk while the crawler keeps up with the frontier.
+        Requests which cannot be serialized are always kept in memory.
+
+    """
+
+    _memory: deque[Request]
+    _write_buffer: list[bytes]
+    _disk_size: int
+    _directory: tempfile.TemporaryDirectory
+    _connection: sqlite3.Connection
+
+    def __init__(self, settings: "FrontierSettings", serializer: RequestSerializer) -> None:
+        super().__init__(settings, serializer)
+        self._memory = deque()
+        self._write_buffer = []
+        self._disk_size = 0
+
+        if settings.directory:
+            Path(settings.directory).mkdir(parents=True, exist_ok=True)
+        self._directory = tempfile.TemporaryDirectory(  # pylint: disable=R1732
+            prefix="fastcrawl-frontier-", dir=settings.directory
+        )
+        self._connection = sqlite3.connect(Path(self._directory.name) / "frontier.sqlite", isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.execute("CREATE TABLE requests (id INTEGER PRIMARY KEY, data BLOB NOT NULL)")
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._write_buffer) + self._disk_size
+
+    def push(self, request: Request) -> None:
+        """See `BaseFrontier` class."""
+        if not self._write_buffer and not self._disk_size and len(self._memory) < self.settings.memory_limit:
+            self._memory.append(request)
+            return
+
+        try:
+            data = self.serializer.dumps(request)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            self._memory.append(request)
+            return
+
+        self._write_buffer.append(data)
+        if len(self._write_buffer) >= self.settings.batch_size:
+            self._flush_write_buffer()
+
+    def pop(self) -> Request:
+        """See `BaseFrontier` class."""
+        if not self._memory:
+            self._load_batch()
+        return self._memory.popleft()
+
+    def close(self) -> None:
+        """See `BaseFrontier` class."""
+        self._connection.close()
+        self._directory.cleanup()
+
+    def _flush_write_buffer(self) -> None:
+        self._connection.executemany("INSERT INTO requests (data) VALUES (?)", ((data,) for data in self._write_buffer))
+        self._disk_size += len(self._write_buffer)
+        self._write_buffer = []
+
+    def _load_batch(self) -> None:
+        if self._disk_size:
+            rows = self._connection.execute(
+                "SELECT id, data FROM requests ORDER BY id LIMIT ?", (self.settings.batch_size,)
+            ).fetchall()
+            self._connection.execute("DELETE FROM requests WHERE id <= ?", (rows[-1][0],))
+            self._disk_size -= len(rows)
+            batch = [data for _, data in rows]
+        else:
+            batch, self._write_buffer = self._write_buffer, []
+        self._memory.extend(self.serializer.loads(data) for data in batch)
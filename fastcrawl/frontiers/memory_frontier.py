@@ -0,0 +1,30 @@
+from collections import deque
+from typing import TYPE_CHECKING
+
+from fastcrawl.frontiers.base_frontier import BaseFrontier
+from fastcrawl.models.request import Request
+from fastcrawl.utils.serialization import RequestSerializer
+
+if TYPE_CHECKING:
+    from fastcrawl.models.frontier_settings import FrontierSettings  # pragma: no cover
+
+
+class MemoryFrontier(BaseFrontier):
+    """Frontier which stores all requests in memory in FIFO order."""
+
+    _requests: deque[Request]
+
+    def __init__(self, settings: "FrontierSettings", serializer: RequestSerializer) -> None:
+        super().__init__(settings, serializer)
+        self._requests = deque()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def push(self, request: Request) -> None:
+        """See `BaseFrontier` class."""
+        self._requests.append(request)
+
+    def pop(self) -> Request:
+        """See `BaseFrontier` class."""
+        return self._requests.popleft()
@@ -1,5 +1,7 @@
 from .crawler_settings import CrawlerSettings
 from .crawler_stats import CrawlerStats
+from .dupefilter_settings import DupeFilterSettings
+from .frontier_settings import FrontierSettings
 from .http_client_settings import HttpClientSettings
 from .log_settings import LogSettings
 from .request import Request
@@ -5,6 +5,8 @@ from pydantic.functional_serializers import PlainSerializer
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from fastcrawl.base_pipeline import BasePipeline
+from fastcrawl.models.dupefilter_settings import DupeFilterSettings
+from fastcrawl.models.frontier_settings import FrontierSettings
 from fastcrawl.models.http_client_settings import HttpClientSettings
 from fastcrawl.models.log_settings import LogSettings
 
@@ -14,8 +16,14 @@ class CrawlerSettings(BaseSettings):
 
     Attributes:
         workers (int): Number of workers to process requests. Default is 15.
+        seed_queue_size (int): Maximum number of queued requests while seeding. Requests from `generate_requests`
+            are queued concurrently with processing, and seeding is paused while the queue has this many
+            requests. Default is 1000.
         pipelines (list[type[BasePipeline]]): List of pipelines to process items.
             Pipelines will be executed in the order they are defined. Default is [].
+        dupefilter (DupeFilterSettings): Duplicate request filter settings for the crawler.
+            Default is DupeFilterSettings().
+        frontier (FrontierSettings): Frontier settings for the crawler. Default is FrontierSettings().
         log (LogSettings): Log settings for the crawler. Default is LogSettings().
         http_client (HttpClientSettings): HTTP client settings for the crawler. Default is HttpClientSettings().
         additional_success_status_codes (list[int]): List of additional response status codes which will be
@@ -24,7 +32,10 @@ class CrawlerSettings(BaseSettings):
     """
 
     workers: int = 15
+    seed_queue_size: int = 1000
     pipelines: list[Annotated[type[BasePipeline], PlainSerializer(lambda x: x.__name__)]] = []
+    dupefilter: DupeFilterSettings = DupeFilterSettings()
+    frontier: FrontierSettings = FrontierSettings()
     log: LogSettings = LogSettings()
     http_client: HttpClientSettings = HttpClientSettings()
     additional_success_status_codes: list[int] = []
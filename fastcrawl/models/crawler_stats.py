@@ -14,6 +14,7 @@ class CrawlerStats(BaseModel):
         started_at (Optional[datetime]): The time when the crawling started. Default is None.
         finished_at (Optional[datetime]): The time when the crawling finished. Default is None.
         requests (Optional[int]): The number of requests made during the crawling. Default is None.
+        filtered_requests (Optional[int]): The number of duplicate requests skipped by the filter. Default is None.
         responses_by_codes (Optional[dict[int, int]]): The number of responses by status code. Default is None.
         items (Optional[int]): The number of items crawled. Default is None.
 
@@ -22,6 +23,7 @@ class CrawlerStats(BaseModel):
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     requests: Optional[int] = None
+    filtered_requests: Optional[int] = None
     responses_by_codes: Optional[dict[int, int]] = None
     items: Optional[int] = None
 
@@ -40,6 +42,13 @@ class CrawlerStats(BaseModel):
         else:
             self.requests = 1
 
+    def add_filtered_request(self) -> None:
+        """Increases the number of duplicate requests skipped by the filter."""
+        if self.filtered_requests:
+            self.filtered_requests += 1
+        else:
+            self.filtered_requests = 1
+
     def add_response(self, status_code: int) -> None:
         """Increases the number of responses by status code."""
         if self.responses_by_codes is None:
@@ -0,0 +1,24 @@
+from typing import Annotated, Optional
+
+from pydantic import BaseModel
+from pydantic.functional_serializers import PlainSerializer
+
+from fastcrawl.dupefilters import BaseDupeFilter
+
+
+class DupeFilterSettings(BaseModel):
+    """Duplicate request filter settings model.
+
+    Attributes:
+        dupefilter_class (Optional[type[BaseDupeFilter]]): Class of the filter to skip duplicate requests.
+            Use `SetDupeFilter` for exact filtering or `BloomDupeFilter` for compact probabilistic filtering
+            of very large crawls. Requests with `dont_filter` are never filtered. If not provided,
+            requests are not filtered. Default is None.
+        capacity (int): Expected number of unique requests for filters with fixed memory usage. Default is 10000000.
+        error_rate (float): Acceptable rate of false positives for probabilistic filters. Default is 0.001.
+
+    """
+
+    dupefilter_class: Optional[Annotated[type[BaseDupeFilter], PlainSerializer(lambda x: x.__name__)]] = None
+    capacity: int = 10_000_000
+    error_rate: float = 0.001
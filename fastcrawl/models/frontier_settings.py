@@ -0,0 +1,27 @@
+from pathlib import Path
+from typing import Annotated, Optional, Union
+
+from pydantic import BaseModel
+from pydantic.functional_serializers import PlainSerializer
+
+from fastcrawl.frontiers import BaseFrontier, MemoryFrontier
+
+
+class FrontierSettings(BaseModel):
+    """Frontier settings model.
+
+    Attributes:
+        frontier_class (type[BaseFrontier]): Class of the frontier to store requests waiting to be processed.
+            Use `DiskFrontier` to keep memory usage bounded on large crawls. Default is MemoryFrontier.
+        memory_limit (int): Maximum number of requests kept in memory by frontiers which spill requests to disk.
+            Default is 10000.
+        directory (Optional[Union[Path, str]]): Directory for frontier files. If not provided,
+            a temporary directory is used. Default is None.
+        batch_size (int): Number of requests written to or read from disk at once. Default is 1000.
+
+    """
+
+    frontier_class: Annotated[type[BaseFrontier], PlainSerializer(lambda x: x.__name__)] = MemoryFrontier
+    memory_limit: int = 10000
+    directory: Optional[Union[Path, str]] = None
+    batch_size: int = 1000
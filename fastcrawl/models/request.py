@@ -34,6 +34,7 @@ class Request(BaseModel):
         auth (Optional[Auth]): Authentication credentials. Default is None.
         timeout (Optional[float]): Timeout for the request in seconds. Default is None.
         follow_redirects (Optional[bool]): Whether to follow redirects. Default is None.
+        dont_filter (bool): Whether to skip the duplicate request filter for the request. Default is False.
 
     """
 
@@ -51,6 +52,7 @@ class Request(BaseModel):
     auth: Optional[Auth] = None
     timeout: Optional[float] = None
     follow_redirects: Optional[bool] = None
+    dont_filter: bool = False
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
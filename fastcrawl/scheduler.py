@@ -0,0 +1,82 @@
+import asyncio
+
+from fastcrawl.frontiers import BaseFrontier
+from fastcrawl.models import Request
+
+
+class Scheduler:
+    """Queue of requests waiting to be processed by crawler workers.
+
+    Args:
+        frontier (BaseFrontier): Frontier to store queued requests.
+
+    Note:
+        Putting a request never blocks, so workers can always enqueue requests yielded by callbacks.
+        Producers that should be throttled (e.g. seed generators) must call `wait_for_space` before putting.
+
+    """
+
+    _frontier: BaseFrontier
+    _unfinished_requests: int
+    _finished: asyncio.Event
+    _request_added: asyncio.Condition
+    _request_taken: asyncio.Condition
+
+    def __init__(self, frontier: BaseFrontier) -> None:
+        self._frontier = frontier
+        self._unfinished_requests = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._request_added = asyncio.Condition()
+        self._request_taken = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._frontier)
+
+    async def put(self, request: Request) -> None:
+        """Adds a request to the queue.
+
+        Args:
+            request (Request): Request to add.
+
+        """
+        self._frontier.push(request)
+        self._unfinished_requests += 1
+        self._finished.clear()
+        async with self._request_added:
+            self._request_added.notify()
+
+    async def get(self) -> Request:
+        """Removes and returns a request from the queue. If the queue is empty, waits until a request is added."""
+        async with self._request_added:
+            await self._request_added.wait_for(lambda: len(self._frontier) > 0)
+            request = self._frontier.pop()
+        async with self._request_taken:
+            self._request_taken.notify_all()
+        return request
+
+    def task_done(self) -> None:
+        """Indicates that a request taken with `get` was processed."""
+        if self._unfinished_requests <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_requests -= 1
+        if self._unfinished_requests == 0:
+            self._finished.set()
+
+    async def wait_for_space(self, max_size: int) -> None:
+        """Waits until the number of queued requests is less than `max_size`.
+
+        Args:
+            max_size (int): Maximum number of queued requests.
+
+        """
+        async with self._request_taken:
+            await self._request_taken.wait_for(lambda: len(self._frontier) < max_size)
+
+    async def join(self) -> None:
+        """Waits until all added requests are processed."""
+        await self._finished.wait()
+
+    def close(self) -> None:
+        """Closes the frontier."""
+        self._frontier.close()
@@ -0,0 +1,66 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import parse_qsl, quote, urlencode
+
+from httpx import URL
+
+if TYPE_CHECKING:
+    from fastcrawl.models.request import Request  # pragma: no cover
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PATH_SAFE_CHARACTERS = "/:@!$&'()*+,;=-._~"
+
+
+def get_request_fingerprint(request: "Request") -> bytes:
+    """Returns fingerprint of the request.
+
+    Note:
+        Requests get the same fingerprint if they have the same method, canonical URL and body.
+        URL is canonicalized by lowercasing scheme and host, removing default port and fragment,
+        normalizing path encoding and sorting query parameters (including `query_params` of the request).
+
+    Args:
+        request (Request): Request to get fingerprint for.
+
+    """
+    fingerprint = hashlib.sha1(request.method.upper().encode())
+    fingerprint.update(b"\0")
+    fingerprint.update(get_canonical_url(request.url, request.query_params).encode())
+    fingerprint.update(b"\0")
+    fingerprint.update(_get_body_hash(request))
+    return fingerprint.digest()
+
+
+def get_canonical_url(url: Any, query_params: Optional[Any] = None) -> str:
+    """Returns canonical form of the URL.
+
+    Args:
+        url (Any): URL to canonicalize.
+        query_params (Optional[Any]): Query parameters to merge into the URL. Default is None.
+
+    """
+    url = URL(url)
+    if query_params:
+        url = url.copy_merge_params(query_params)
+
+    port = url.port
+    netloc = url.host if port is None or port == _DEFAULT_PORTS.get(url.scheme) else f"{url.host}:{port}"
+    path = quote(url.path or "/", safe=_PATH_SAFE_CHARACTERS)
+    query = urlencode(sorted(parse_qsl(url.query.decode("ascii"), keep_blank_values=True)))
+    return f"{url.scheme}://{netloc}{path}{'?' if query else ''}{query}"
+
+
+def _get_body_hash(request: "Request") -> bytes:
+    body_hash = hashlib.sha1()
+    if request.form_data is not None:
+        body_hash.update(urlencode(sorted(request.form_data.items()), doseq=True).encode())
+    body_hash.update(b"\0")
+    if request.json_data is not None:
+        body_hash.update(json.dumps(request.json_data, sort_keys=True, default=str).encode())
+    body_hash.update(b"\0")
+    if request.files is not None:
+        for name, content in sorted(request.files.items()):
+            body_hash.update(name.encode())
+            body_hash.update(hashlib.sha1(content).digest())
+    return body_hash.digest()
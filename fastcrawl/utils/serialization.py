@@ -0,0 +1,67 @@
+import pickle
+from typing import Any, Optional
+
+from fastcrawl.models.request import Request
+
+_CALLBACK_FIELDS = ("callback", "errback")
+
+
+class RequestSerializer:
+    """Serializer of requests to bytes and back.
+
+    Note:
+        Callbacks which are methods of the crawler are stored by name and resolved on the crawler
+        during deserialization. Other callbacks and field values are pickled as is,
+        so they must be picklable (e.g. module-level functions, not lambdas).
+
+    Args:
+        crawler (Optional[Any]): Crawler whose methods are used as request callbacks. Default is None.
+
+    """
+
+    _crawler: Optional[Any]
+
+    def __init__(self, crawler: Optional[Any] = None) -> None:
+        self._crawler = crawler
+
+    def dumps(self, request: Request) -> bytes:
+        """Returns serialized request.
+
+        Args:
+            request (Request): Request to serialize.
+
+        Raises:
+            pickle.PicklingError, AttributeError, TypeError: If the request contains unpicklable values.
+
+        """
+        data = {}
+        for field_name in request.model_fields_set:
+            value = getattr(request, field_name)
+            if field_name in _CALLBACK_FIELDS and value is not None:
+                value = self._dump_callback(value)
+            data[field_name] = value
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Request:
+        """Returns request deserialized from bytes.
+
+        Args:
+            data (bytes): Serialized request.
+
+        """
+        fields = pickle.loads(data)
+        for field_name in _CALLBACK_FIELDS:
+            if fields.get(field_name) is not None:
+                fields[field_name] = self._load_callback(fields[field_name])
+        return Request.model_construct(**fields)
+
+    def _dump_callback(self, callback: Any) -> tuple[str, Any]:
+        if self._crawler is not None and getattr(callback, "__self__", None) is self._crawler:
+            return "method", callback.__name__
+        return "object", callback
+
+    def _load_callback(self, reference: tuple[str, Any]) -> Any:
+        kind, value = reference
+        if kind == "method":
+            return getattr(self._crawler, value)
+        return value
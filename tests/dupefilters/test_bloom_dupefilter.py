@@ -0,0 +1,34 @@
+import hashlib
+
+from fastcrawl import BloomDupeFilter, DupeFilterSettings
+from tests.mocks import create_request
+
+
+def test_size() -> None:
+    """Tests the size of the `BloomDupeFilter` class depending on settings."""
+    dupefilter = BloomDupeFilter(DupeFilterSettings(capacity=1_000_000, error_rate=0.001))
+    assert 14_000_000 < dupefilter.bits_count < 15_000_000
+    assert dupefilter.hashes_count == 10
+
+
+def test_request_seen() -> None:
+    """Tests the `request_seen` method of the `BloomDupeFilter` class."""
+    dupefilter = BloomDupeFilter(DupeFilterSettings(capacity=100))
+
+    assert not dupefilter.request_seen(create_request(url="https://example.com/1"))
+    assert dupefilter.request_seen(create_request(url="https://example.com/1"))
+    assert not dupefilter.request_seen(create_request(url="https://example.com/2"))
+
+
+def test_error_rate() -> None:
+    """Tests that false positive rate of the `BloomDupeFilter` class is close to the configured one."""
+    capacity = 10_000
+    error_rate = 0.01
+    dupefilter = BloomDupeFilter(DupeFilterSettings(capacity=capacity, error_rate=error_rate))
+
+    for index in range(capacity):
+        assert not dupefilter.fingerprint_seen(hashlib.sha1(f"seen_{index}".encode()).digest())
+    false_positives = sum(
+        dupefilter.fingerprint_seen(hashlib.sha1(f"new_{index}".encode()).digest()) for index in range(capacity)
+    )
+    assert false_positives < capacity * error_rate * 2
@@ -0,0 +1,12 @@
+from fastcrawl import DupeFilterSettings, SetDupeFilter
+from tests.mocks import create_request
+
+
+def test_request_seen() -> None:
+    """Tests the `request_seen` method of the `SetDupeFilter` class."""
+    dupefilter = SetDupeFilter(DupeFilterSettings())
+
+    assert not dupefilter.request_seen(create_request(url="https://example.com/1"))
+    assert dupefilter.request_seen(create_request(url="https://example.com/1"))
+    assert not dupefilter.request_seen(create_request(url="https://example.com/2"))
+    assert len(dupefilter) == 2
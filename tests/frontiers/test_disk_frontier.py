@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from fastcrawl import DiskFrontier
+from tests.mocks import create_frontier, create_request, mock_callback
+
+
+@pytest.mark.parametrize(["memory_limit", "batch_size"], [(0, 1), (2, 3), (5, 2), (100, 10)])
+def test_push_and_pop(memory_limit: int, batch_size: int, tmp_path: Path) -> None:
+    """Tests that the `DiskFrontier` class returns requests in FIFO order.
+
+    Args:
+        memory_limit (int): Maximum number of requests kept in memory.
+        batch_size (int): Number of requests written to or read from disk at once.
+        tmp_path (Path): A temporary path for the frontier files.
+
+    """
+    frontier = create_frontier(DiskFrontier, memory_limit=memory_limit, batch_size=batch_size, directory=tmp_path)
+    urls = [f"https://example.com/{index}" for index in range(10)]
+
+    for url in urls[:6]:
+        frontier.push(create_request(url=url, callback=mock_callback))
+    popped_urls = [frontier.pop().url for _ in range(3)]
+    for url in urls[6:]:
+        frontier.push(create_request(url=url, callback=mock_callback))
+    assert len(frontier) == 7
+
+    popped_urls.extend(frontier.pop().url for _ in range(7))
+    assert popped_urls == urls
+    assert len(frontier) == 0
+    with pytest.raises(IndexError):
+        frontier.pop()
+
+    frontier.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_push_unserializable_request() -> None:
+    """Tests that the `DiskFrontier` class keeps unserializable requests in memory."""
+    frontier = create_frontier(DiskFrontier, memory_limit=0, batch_size=1)
+    request = create_request(callback=lambda _: None)
+
+    frontier.push(request)
+    assert frontier.pop() is request
+    frontier.close()
@@ -0,0 +1,18 @@
+import pytest
+
+from tests.mocks import create_frontier, create_request
+
+
+def test_push_and_pop() -> None:
+    """Tests the `push` and `pop` methods of the `MemoryFrontier` class."""
+    frontier = create_frontier()
+    requests = [create_request(url=f"https://example.com/{index}") for index in range(3)]
+
+    for request in requests:
+        frontier.push(request)
+    assert len(frontier) == len(requests)
+
+    assert [frontier.pop() for _ in requests] == requests
+    assert len(frontier) == 0
+    with pytest.raises(IndexError):
+        frontier.pop()
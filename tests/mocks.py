@@ -4,7 +4,16 @@ from httpx import URL
 from httpx import Request as HttpxRequest
 from httpx import Response as HttpxResponse
 
-from fastcrawl import BasePipeline, LogSettings, Request, Response
+from fastcrawl import (
+    BaseFrontier,
+    BasePipeline,
+    FrontierSettings,
+    LogSettings,
+    MemoryFrontier,
+    Request,
+    Response,
+)
+from fastcrawl.utils.serialization import RequestSerializer
 
 
 class MockStrPipeline(BasePipeline):
@@ -51,6 +60,25 @@ def create_request(
     return Request(url=url, callback=callback, **kwargs)
 
 
+def mock_callback(response: Response) -> None:  # pylint: disable=W0613
+    """A picklable mock callback for requests."""
+
+
+def create_frontier(
+    frontier_class: type[BaseFrontier] = MemoryFrontier, serializer: Optional[RequestSerializer] = None, **kwargs
+) -> BaseFrontier:
+    """Returns frontier instance.
+
+    Args:
+        frontier_class (type[BaseFrontier]): Class of the frontier. Default is MemoryFrontier.
+        serializer (Optional[RequestSerializer]): Serializer for the frontier.
+            If not provided, a new serializer without crawler will be created. Default is None.
+        **kwargs: Additional keyword arguments for the frontier settings.
+
+    """
+    return frontier_class(FrontierSettings(**kwargs), serializer or RequestSerializer())
+
+
 def create_response(
     url: URL = URL("https://example.com/"),
     status_code: int = 200,
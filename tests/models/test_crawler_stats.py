@@ -45,3 +45,12 @@ def test_add_item() -> None:
     assert stats.items == 1
     stats.add_item()
     assert stats.items == 2
+
+
+def test_add_filtered_request() -> None:
+    """Tests the `add_filtered_request` method of the `CrawlerStats` class."""
+    stats = CrawlerStats()
+    stats.add_filtered_request()
+    assert stats.filtered_requests == 1
+    stats.add_filtered_request()
+    assert stats.filtered_requests == 2
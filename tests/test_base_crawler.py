@@ -7,9 +7,13 @@ from pytest_httpx import HTTPXMock
 from fastcrawl import (
     BaseCrawler,
     CrawlerSettings,
+    DiskFrontier,
+    DupeFilterSettings,
+    FrontierSettings,
     HttpClientSettings,
     Request,
     Response,
+    SetDupeFilter,
 )
 from tests.mocks import MockStrDropPipeline, MockStrPipeline
 
@@ -83,3 +87,90 @@ async def test_run(httpx_mock: HTTPXMock) -> None:
         },
     )
     await crawler.run()
+
+
+class MockSeedingCrawler(BaseCrawler):
+    """A mock class for testing seeding of the `BaseCrawler` class.
+
+    Args:
+        seeds_count (int): The number of seed requests to generate.
+        **kwargs: Additional keyword arguments to pass to the `BaseCrawler` class.
+
+    """
+
+    def __init__(self, seeds_count: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.seeds_count = seeds_count
+        self.events: list[str] = []
+
+    async def generate_requests(self) -> AsyncIterator[Request]:
+        """See `BaseCrawler` class."""
+        for index in range(self.seeds_count):
+            self.events.append(f"seed_{index}")
+            yield Request(url=f"https://example.com/{index}", callback=self.parse)
+
+    async def parse(self, response: Response) -> None:
+        """Mock parse method that records the processed response."""
+        self.events.append(f"response_{response.url.path.strip('/')}")
+
+
+@pytest.mark.asyncio
+async def test_run_streams_seed_requests(httpx_mock: HTTPXMock) -> None:
+    """Tests that the `run` method of the `BaseCrawler` class processes seed requests while seeding."""
+    seeds_count = 5
+    for _ in range(seeds_count):
+        httpx_mock.add_response()
+
+    crawler = MockSeedingCrawler(seeds_count, settings=CrawlerSettings(workers=1, seed_queue_size=1))
+    await crawler.run()
+
+    assert crawler.stats.requests == seeds_count
+    assert crawler.events.index("response_0") < crawler.events.index(f"seed_{seeds_count - 1}")
+
+
+@pytest.mark.asyncio
+async def test_run_with_disk_frontier(httpx_mock: HTTPXMock) -> None:
+    """Tests the `run` method of the `BaseCrawler` class with the `DiskFrontier`."""
+    seeds_count = 5
+    for _ in range(seeds_count):
+        httpx_mock.add_response()
+
+    crawler = MockSeedingCrawler(
+        seeds_count,
+        settings=CrawlerSettings(
+            seed_queue_size=seeds_count,
+            frontier=FrontierSettings(frontier_class=DiskFrontier, memory_limit=1, batch_size=2),
+        ),
+    )
+    await crawler.run()
+
+    assert crawler.stats.requests == seeds_count
+    assert sorted(event for event in crawler.events if event.startswith("response_")) == [
+        f"response_{index}" for index in range(seeds_count)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dont_filter", [False, True])
+async def test_run_with_dupefilter(dont_filter: bool, httpx_mock: HTTPXMock) -> None:
+    """Tests the `run` method of the `BaseCrawler` class with the duplicate request filter.
+
+    Args:
+        dont_filter (bool): Whether to skip the filter for the requests.
+
+    """
+    httpx_mock.add_response(is_reusable=True)
+
+    crawler = MockCrawler(
+        settings=CrawlerSettings(dupefilter=DupeFilterSettings(dupefilter_class=SetDupeFilter)),
+        first_request_kwargs={"dont_filter": dont_filter},
+    )
+    crawler.parse_with_error = crawler.parse_with_return  # type: ignore[method-assign]
+    await crawler.run()
+
+    if dont_filter:
+        assert crawler.stats.requests == 2
+        assert crawler.stats.filtered_requests == 1
+    else:
+        assert crawler.stats.requests == 1
+        assert crawler.stats.filtered_requests == 1
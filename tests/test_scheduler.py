@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from fastcrawl.scheduler import Scheduler
+from tests.mocks import create_frontier, create_request
+
+
+@pytest.mark.asyncio
+async def test_put_and_get() -> None:
+    """Tests the `put` and `get` methods of the `Scheduler` class."""
+    scheduler = Scheduler(create_frontier())
+    first_request = create_request(url="https://example.com/1")
+    second_request = create_request(url="https://example.com/2")
+
+    await scheduler.put(first_request)
+    await scheduler.put(second_request)
+    assert len(scheduler) == 2
+
+    assert await scheduler.get() is first_request
+    assert await scheduler.get() is second_request
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_request() -> None:
+    """Tests that the `get` method of the `Scheduler` class waits until a request is added."""
+    scheduler = Scheduler(create_frontier())
+    request = create_request()
+
+    get_task = asyncio.create_task(scheduler.get())
+    await asyncio.sleep(0)
+    assert not get_task.done()
+
+    await scheduler.put(request)
+    assert await asyncio.wait_for(get_task, timeout=1) is request
+
+
+@pytest.mark.asyncio
+async def test_task_done_and_join() -> None:
+    """Tests the `task_done` and `join` methods of the `Scheduler` class."""
+    scheduler = Scheduler(create_frontier())
+    await asyncio.wait_for(scheduler.join(), timeout=1)
+
+    await scheduler.put(create_request())
+    await scheduler.get()
+    join_task = asyncio.create_task(scheduler.join())
+    await asyncio.sleep(0)
+    assert not join_task.done()
+
+    scheduler.task_done()
+    await asyncio.wait_for(join_task, timeout=1)
+
+    with pytest.raises(ValueError):
+        scheduler.task_done()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_space() -> None:
+    """Tests the `wait_for_space` method of the `Scheduler` class."""
+    scheduler = Scheduler(create_frontier())
+    await scheduler.put(create_request())
+    await scheduler.put(create_request())
+
+    wait_task = asyncio.create_task(scheduler.wait_for_space(2))
+    await asyncio.sleep(0)
+    assert not wait_task.done()
+
+    await scheduler.get()
+    await asyncio.wait_for(wait_task, timeout=1)
@@ -0,0 +1,58 @@
+import pytest
+
+from fastcrawl.utils.fingerprint import get_canonical_url, get_request_fingerprint
+from tests.mocks import create_request
+
+
+@pytest.mark.parametrize(
+    ["url", "query_params", "canonical_url"],
+    [
+        ("https://example.com", None, "https://example.com/"),
+        ("HTTPS://Example.COM:443/path#fragment", None, "https://example.com/path"),
+        ("http://example.com:80/a/../b", None, "http://example.com/b"),
+        ("http://example.com:8080/", None, "http://example.com:8080/"),
+        ("https://example.com/?b=2&a=1&a=0", None, "https://example.com/?a=0&a=1&b=2"),
+        ("https://example.com/?b=2", {"a": "1"}, "https://example.com/?a=1&b=2"),
+        ("https://example.com/%7euser?q=a%20b", None, "https://example.com/~user?q=a+b"),
+    ],
+)
+def test_get_canonical_url(url: str, query_params: dict[str, str], canonical_url: str) -> None:
+    """Tests the `get_canonical_url` function.
+
+    Args:
+        url (str): URL to canonicalize.
+        query_params (dict[str, str]): Query parameters to merge into the URL.
+        canonical_url (str): Expected canonical URL.
+
+    """
+    assert get_canonical_url(url, query_params) == canonical_url
+
+
+def test_get_request_fingerprint() -> None:
+    """Tests the `get_request_fingerprint` function."""
+    fingerprint = get_request_fingerprint(create_request(url="https://example.com/?a=1&b=2"))
+    assert len(fingerprint) == 20
+
+    assert fingerprint == get_request_fingerprint(create_request(url="https://EXAMPLE.com/?b=2", query_params={"a": 1}))
+    assert fingerprint == get_request_fingerprint(create_request(url="https://example.com/?b=2&a=1", method="get"))
+    assert fingerprint != get_request_fingerprint(create_request(url="https://example.com/?a=1&b=2", method="POST"))
+    assert fingerprint != get_request_fingerprint(create_request(url="https://example.com/?a=1&b=3"))
+
+
+def test_get_request_fingerprint_with_body() -> None:
+    """Tests the `get_request_fingerprint` function with request body."""
+    url = "https://example.com/"
+    form_fingerprint = get_request_fingerprint(create_request(url=url, method="POST", form_data={"a": 1, "b": 2}))
+    json_fingerprint = get_request_fingerprint(create_request(url=url, method="POST", json_data={"a": 1, "b": 2}))
+    files_fingerprint = get_request_fingerprint(create_request(url=url, method="POST", files={"file": b"content"}))
+
+    assert len({form_fingerprint, json_fingerprint, files_fingerprint}) == 3
+    assert form_fingerprint == get_request_fingerprint(
+        create_request(url=url, method="POST", form_data={"b": 2, "a": 1})
+    )
+    assert json_fingerprint == get_request_fingerprint(
+        create_request(url=url, method="POST", json_data={"b": 2, "a": 1})
+    )
+    assert files_fingerprint != get_request_fingerprint(
+        create_request(url=url, method="POST", files={"file": b"other"})
+    )
@@ -0,0 +1,47 @@
+import pickle
+from typing import AsyncIterator
+
+import pytest
+from httpx import URL
+
+from fastcrawl import BaseCrawler, Request, Response
+from fastcrawl.utils.serialization import RequestSerializer
+from tests.mocks import create_request, mock_callback
+
+
+class MockCrawler(BaseCrawler):
+    """A mock class for testing the `RequestSerializer` class."""
+
+    async def generate_requests(self) -> AsyncIterator[Request]:
+        """See `BaseCrawler` class."""
+        yield Request(url="https://example.com/", callback=self.parse)
+
+    async def parse(self, response: Response) -> None:
+        """Mock parse method."""
+
+
+def test_dumps_and_loads() -> None:
+    """Tests the `dumps` and `loads` methods of the `RequestSerializer` class."""
+    crawler = MockCrawler()
+    serializer = RequestSerializer(crawler)
+    request = create_request(
+        method="POST",
+        url=URL("https://example.com/"),
+        callback=crawler.parse,
+        errback=mock_callback,
+        callback_data={"key": "value"},
+        headers={"header": "value"},
+    )
+
+    loaded_request = serializer.loads(serializer.dumps(request))
+    assert loaded_request == request
+    assert loaded_request.callback.__self__ is crawler  # type: ignore[union-attr]
+    assert loaded_request.callback.__name__ == "parse"
+    assert loaded_request.errback is mock_callback
+
+
+def test_dumps_unpicklable_callback() -> None:
+    """Tests the `dumps` method of the `RequestSerializer` class with an unpicklable callback."""
+    serializer = RequestSerializer()
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        serializer.dumps(create_request(callback=lambda _: None))